@@ -81,6 +81,9 @@ COLUMN_NAMES = {
     'comments': 'Additional Comments or Suggestions'
 }
 
+# Full question text -> short name, built once for rename_columns()
+_INV_COLUMN_NAMES = {v: k for k, v in COLUMN_NAMES.items()}
+
 # =============================================================================
 # DASHBOARD CONFIGURATION
 # =============================================================================
@@ -127,12 +130,22 @@ def get_credentials_local():
     return SERVICE_ACCOUNT_PATH, SPREADSHEET_ID
 
 
+def rename_columns(df):
+    """
+    Rename form question columns to their short names from COLUMN_NAMES.
+
+    Usage:
+        df_renamed = rename_columns(df)
+    """
+    return df.rename(columns=_INV_COLUMN_NAMES)
+
+
 def get_column(df, short_name):
     """
     Helper function to get a column by its short name.
 
     Usage:
-        df_renamed = df.rename(columns={v: k for k, v in COLUMN_NAMES.items()})
+        df_renamed = rename_columns(df)
         experience_col = get_column(df_renamed, 'experience')
     """
     return COLUMN_NAMES.get(short_name, short_name)
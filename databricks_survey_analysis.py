@@ -15,12 +15,17 @@ Each section can be run as a separate cell.
 
 # CELL 2: Import Libraries
 # ========================
+# Plotly is imported inside the plotting functions so that fetching data
+# does not pay for loading the plotting stack
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from collections import Counter
 from datetime import datetime, timedelta
+from functools import lru_cache
+import hashlib
 import json
+import re
+from types import MappingProxyType
 
 # For Databricks
 try:
@@ -54,35 +59,133 @@ else:
     """
     SPREADSHEET_ID = "your-spreadsheet-id-here"
 
+# Low-cardinality questions stored as pandas categoricals after loading
+CATEGORY_COLUMNS = ['Experience Level', 'Primary Role', 'Session Rating']
+
 
 # CELL 4: Data Ingestion Function
 # ===============================
-def fetch_survey_data():
-    """Fetch survey data from Google Sheets."""
+# Google Forms always writes response timestamps in this layout
+TIMESTAMP_FORMAT = '%m/%d/%Y %H:%M:%S'
+
+# Patterns used to find the dashboard columns among the form questions
+COLUMN_ROLE_PATTERNS = {
+    'timestamp': re.compile(r'^Timestamp$'),
+    'experience': re.compile(r'experience', re.I),
+    'tech': re.compile(r'technology|interest', re.I),
+    'rating': re.compile(r'rating', re.I),
+}
+
+
+@lru_cache(maxsize=None)
+def get_column_roles(columns):
+    """
+    Map each dashboard role to the first matching column (or None).
+
+    Args:
+        columns: Tuple of column names, e.g. tuple(df.columns)
+    """
+    roles = dict.fromkeys(COLUMN_ROLE_PATTERNS)
+    for col in columns:
+        for role, pattern in COLUMN_ROLE_PATTERNS.items():
+            if roles[role] is None and pattern.search(col):
+                roles[role] = col
+    # Read-only view: the result is shared through lru_cache
+    return MappingProxyType(roles)
+
+
+def is_text_column(series):
+    """True for text columns: object dtype on pandas 2, str dtype on pandas 3."""
+    return (pd.api.types.is_object_dtype(series)
+            or pd.api.types.is_string_dtype(series))
+
+
+@lru_cache(maxsize=None)
+def _ensure_gspread():
+    """Import the Google Sheets client libraries on first use."""
     import gspread
     from google.oauth2.service_account import Credentials
+    return gspread, Credentials
+
+
+@lru_cache(maxsize=None)
+def get_sheets_client(credentials_json):
+    """Authorize once per credentials; auto-refresh reuses the client."""
+    gspread, Credentials = _ensure_gspread()
 
-    # Authenticate
     scopes = [
         'https://www.googleapis.com/auth/spreadsheets.readonly',
         'https://www.googleapis.com/auth/drive.readonly'
     ]
 
-    creds_dict = json.loads(CREDENTIALS_JSON)
+    creds_dict = json.loads(credentials_json)
     creds = Credentials.from_service_account_info(creds_dict, scopes=scopes)
-    client = gspread.authorize(creds)
+    return gspread.authorize(creds)
+
+
+@lru_cache(maxsize=None)
+def get_worksheet(spreadsheet_id, worksheet_name="Form Responses 1"):
+    """Open the responses worksheet once and reuse the handle."""
+    client = get_sheets_client(CREDENTIALS_JSON)
+    spreadsheet = client.open_by_key(spreadsheet_id)
+    return spreadsheet.worksheet(worksheet_name)
+
+
+def fetch_response_count():
+    """Count responses by reading only the Timestamp column."""
+    worksheet = get_worksheet(SPREADSHEET_ID)
+    return max(0, len(worksheet.col_values(1)) - 1)
+
 
+def _to_numeric_columns(df):
+    """
+    Convert columns whose answers are all numbers; blanks become NaN.
+
+    Columns with no answers at all (e.g. a header-only sheet) stay text.
+    """
+    for col in df.columns:
+        answered = df[col] != ''
+        if not answered.any():
+            continue
+        try:
+            numbers = pd.to_numeric(df[col][answered])
+        except (ValueError, TypeError):
+            continue
+        # Reindexing puts NaN in the blank rows without parsing again
+        df[col] = numbers.reindex(df.index)
+    return df
+
+
+def fetch_survey_data():
+    """Fetch survey data from Google Sheets."""
     # Open spreadsheet and get data
-    spreadsheet = client.open_by_key(SPREADSHEET_ID)
-    worksheet = spreadsheet.worksheet("Form Responses 1")
-    data = worksheet.get_all_records()
+    worksheet = get_worksheet(SPREADSHEET_ID)
+    values = worksheet.get_all_values()
+    if not values:
+        return pd.DataFrame()
 
-    # Convert to DataFrame
-    df = pd.DataFrame(data)
+    # Convert to DataFrame, header row becomes the columns
+    df = pd.DataFrame(values[1:], columns=values[0])
 
-    # Parse timestamp if exists
+    # Convert columns whose answers are all numbers (e.g. ratings)
+    df = _to_numeric_columns(df)
+
+    # Parse timestamp if exists; unparseable values become NaT
     if 'Timestamp' in df.columns:
-        df['Timestamp'] = pd.to_datetime(df['Timestamp'])
+        df['Timestamp'] = pd.to_datetime(df['Timestamp'],
+                                         format=TIMESTAMP_FORMAT,
+                                         cache=True, errors='coerce')
+
+    # Numeric ratings as float32 once at load; text ratings are left intact
+    # and coerced only when plotted (see rating_values)
+    rating_col = get_column_roles(tuple(df.columns))['rating']
+    if rating_col and pd.api.types.is_numeric_dtype(df[rating_col]):
+        df[rating_col] = df[rating_col].astype('float32')
+
+    # Text answers with few distinct values are cheaper to count as categories
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and is_text_column(df[col]):
+            df[col] = df[col].astype('category')
 
     return df
 
@@ -97,10 +200,19 @@ print(f"Columns: {list(df.columns)}")
 print("\nFirst few responses:")
 display(df.head())
 
-# Convert to Spark DataFrame if in Databricks
-if IN_DATABRICKS:
+
+def register_survey_view(df):
+    """(Re)create the survey_responses temp view from a pandas DataFrame."""
     spark_df = spark.createDataFrame(df)
     spark_df.createOrReplaceTempView("survey_responses")
+    return spark_df
+
+
+# Convert to Spark DataFrame if in Databricks
+if IN_DATABRICKS:
+    # Convert pandas -> Spark through Arrow column batches instead of rows
+    spark.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
+    spark_df = register_survey_view(df)
     print("\nCreated temporary view: survey_responses")
 
 
@@ -120,8 +232,19 @@ if 'Timestamp' in df.columns:
 
 print("\nResponse rate over time:")
 if 'Timestamp' in df.columns:
-    df['Hour'] = df['Timestamp'].dt.floor('H')
-    hourly_counts = df.groupby('Hour').size()
+    if IN_DATABRICKS:
+        # Aggregate in Spark; only the per-hour counts come back to pandas
+        hourly_counts = spark.sql("""
+            SELECT date_trunc('hour', Timestamp) AS Hour, COUNT(*) AS count
+            FROM survey_responses
+            WHERE Timestamp IS NOT NULL
+            GROUP BY 1
+            ORDER BY 1
+        """).toPandas().set_index('Hour')['count']
+    else:
+        # Truncate to hour resolution directly on the datetime64 array
+        hours = df['Timestamp'].values.astype('datetime64[h]')
+        hourly_counts = df.groupby(hours).size().rename_axis('Hour')
     print(hourly_counts)
 
 
@@ -129,13 +252,19 @@ if 'Timestamp' in df.columns:
 # =========================================
 def plot_response_timeline(df):
     """Plot responses over time."""
+    import plotly.express as px
+
     if 'Timestamp' not in df.columns:
         print("No timestamp column found")
         return
 
-    # Create cumulative count
-    df_sorted = df.sort_values('Timestamp')
-    df_sorted['Cumulative_Count'] = range(1, len(df_sorted) + 1)
+    # Create cumulative count; Forms appends rows in time order, so the
+    # sort is only needed if that invariant does not hold
+    ts = df['Timestamp']
+    df_sorted = df if ts.is_monotonic_increasing else df.sort_values('Timestamp')
+    df_sorted = df_sorted.assign(
+        Cumulative_Count=np.arange(1, len(df_sorted) + 1, dtype=np.int32)
+    )
 
     fig = px.line(
         df_sorted,
@@ -165,6 +294,8 @@ EXPERIENCE_COLUMN = 'Experience Level'  # Change this to your actual column name
 
 def plot_experience_distribution(df, column_name):
     """Plot distribution of experience levels."""
+    import plotly.express as px
+
     if column_name not in df.columns:
         print(f"Column '{column_name}' not found. Available columns: {list(df.columns)}")
         return
@@ -195,21 +326,29 @@ if EXPERIENCE_COLUMN in df.columns:
 # Adjust to your actual column name
 TECH_INTEREST_COLUMN = 'Primary Technology Interest'
 
+def split_multi_select(series):
+    """Split comma-separated checkbox answers into one answer per row."""
+    values = series.dropna()
+    try:
+        values = values.str.split(',')
+    except AttributeError:
+        # .str refuses columns without any strings (e.g. no answers yet);
+        # like non-string cells in a text column, they hold no choices
+        return values.iloc[:0]
+    return values.explode().str.strip()
+
+
 def plot_technology_interest(df, column_name):
     """Plot technology interest as a pie chart."""
+    import plotly.express as px
+
     if column_name not in df.columns:
         print(f"Column '{column_name}' not found.")
         return
 
     # Handle multiple selections (if checkboxes were used)
     # This splits comma-separated values
-    all_interests = []
-    for response in df[column_name].dropna():
-        if isinstance(response, str):
-            interests = [x.strip() for x in response.split(',')]
-            all_interests.extend(interests)
-
-    interest_counts = pd.Series(all_interests).value_counts()
+    interest_counts = split_multi_select(df[column_name]).value_counts()
 
     fig = px.pie(
         values=interest_counts.values,
@@ -233,14 +372,25 @@ if TECH_INTEREST_COLUMN in df.columns:
 # ========================================
 RATING_COLUMN = 'Session Rating'  # Adjust to your actual column name
 
+def rating_values(series):
+    """Answered ratings as float32, skipping the parse if already numeric."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    if not pd.api.types.is_numeric_dtype(series):
+        series = pd.to_numeric(series, errors='coerce')
+    return series.dropna().astype('float32')
+
+
 def plot_rating_distribution(df, column_name):
     """Plot rating distribution as a histogram."""
+    import plotly.graph_objects as go
+
     if column_name not in df.columns:
         print(f"Column '{column_name}' not found.")
         return
 
     # Convert to numeric if needed
-    ratings = pd.to_numeric(df[column_name], errors='coerce').dropna()
+    ratings = rating_values(df[column_name])
 
     fig = go.Figure()
 
@@ -282,8 +432,41 @@ if RATING_COLUMN in df.columns:
 
 # CELL 11: Real-Time Dashboard
 # ============================
-def create_dashboard(df):
-    """Create a comprehensive dashboard with multiple visualizations."""
+def count_values(df, column, multi_select=False, spark_df=None):
+    """
+    Count answers in a column, most common first.
+
+    When spark_df is given the counting runs in Spark and only the small
+    grouped result is converted back to pandas; spark_df must hold the same
+    rows as df (e.g. the result of register_survey_view(df)).
+
+    Args:
+        df: Survey DataFrame
+        column: Column to count
+        multi_select: Split comma-separated checkbox answers before counting
+        spark_df: Optional Spark DataFrame with the same rows as df
+    """
+    if spark_df is None:
+        if multi_select:
+            return split_multi_select(df[column]).value_counts()
+        return df[column].value_counts()
+
+    col = F.col('`' + column.replace('`', '``') + '`')
+    answers = spark_df.where(col.isNotNull())
+    if multi_select:
+        answers = (answers
+                   .select(F.explode(F.split(col.cast('string'), ',')).alias('answer'))
+                   .select(F.trim('answer').alias('value')))
+    else:
+        answers = answers.select(col.alias('value'))
+    counts = answers.groupBy('value').count().orderBy(F.desc('count')).toPandas()
+    return pd.Series(counts['count'].values, index=counts['value'], name='count')
+
+
+def build_dashboard_figure():
+    """Create the empty 4-panel dashboard layout with one trace per panel."""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
 
     # Create subplots
     fig = make_subplots(
@@ -294,102 +477,172 @@ def create_dashboard(df):
                [{'type': 'pie'}, {'type': 'histogram'}]]
     )
 
+    # Trace order is relied on by update_dashboard
+    fig.add_trace(go.Scatter(x=[], y=[], mode='lines', name='Cumulative'),
+                  row=1, col=1)
+    fig.add_trace(go.Bar(x=[], y=[], name='Experience'), row=1, col=2)
+    fig.add_trace(go.Pie(labels=[], values=[], name='Tech'), row=2, col=1)
+    fig.add_trace(go.Histogram(x=[], nbinsx=5, name='Ratings'), row=2, col=2)
+
+    # Update layout
+    fig.update_layout(height=800, showlegend=False)
+
+    return fig
+
+
+def update_dashboard(fig, df, spark_df=None):
+    """
+    Replace the data shown in a dashboard figure without rebuilding it.
+
+    If spark_df (a Spark DataFrame with the same rows as df) is given, the
+    bar and pie counts are computed in Spark.
+    """
+    roles = get_column_roles(tuple(df.columns))
+
     # 1. Timeline (if timestamp exists)
-    if 'Timestamp' in df.columns:
-        df_sorted = df.sort_values('Timestamp')
-        df_sorted['Count'] = range(1, len(df_sorted) + 1)
-        fig.add_trace(
-            go.Scatter(x=df_sorted['Timestamp'], y=df_sorted['Count'],
-                      mode='lines', name='Cumulative'),
-            row=1, col=1
-        )
+    timeline_x, timeline_y = [], []
+    ts_col = roles['timestamp']
+    if ts_col:
+        ts = df[ts_col]
+        timeline_x = ts if ts.is_monotonic_increasing else ts.sort_values()
+        timeline_y = np.arange(1, len(timeline_x) + 1, dtype=np.int32)
 
     # 2. Experience Level (adjust column name as needed)
-    exp_col = next((col for col in df.columns if 'experience' in col.lower()), None)
+    exp_counts = pd.Series(dtype='int64')
+    exp_col = roles['experience']
     if exp_col:
-        exp_counts = df[exp_col].value_counts()
-        fig.add_trace(
-            go.Bar(x=exp_counts.index, y=exp_counts.values, name='Experience'),
-            row=1, col=2
-        )
+        exp_counts = count_values(df, exp_col, spark_df=spark_df)
 
     # 3. Technology Interest
-    tech_col = next((col for col in df.columns if 'technology' in col.lower() or 'interest' in col.lower()), None)
+    tech_counts = pd.Series(dtype='int64')
+    tech_col = roles['tech']
     if tech_col:
         # Handle multi-select
-        all_tech = []
-        for resp in df[tech_col].dropna():
-            if isinstance(resp, str):
-                all_tech.extend([x.strip() for x in resp.split(',')])
-        tech_counts = pd.Series(all_tech).value_counts()
-        fig.add_trace(
-            go.Pie(labels=tech_counts.index, values=tech_counts.values, name='Tech'),
-            row=2, col=1
-        )
+        tech_counts = count_values(df, tech_col, multi_select=True,
+                                   spark_df=spark_df)
 
     # 4. Ratings
-    rating_col = next((col for col in df.columns if 'rating' in col.lower()), None)
+    ratings = []
+    rating_col = roles['rating']
     if rating_col:
-        ratings = pd.to_numeric(df[rating_col], errors='coerce').dropna()
-        fig.add_trace(
-            go.Histogram(x=ratings, nbinsx=5, name='Ratings'),
-            row=2, col=2
-        )
+        ratings = rating_values(df[rating_col])
 
-    # Update layout
-    fig.update_layout(
-        height=800,
-        showlegend=False,
-        title_text=f"Survey Dashboard - {len(df)} Responses"
-    )
+    with fig.batch_update():
+        fig.data[0].x, fig.data[0].y = timeline_x, timeline_y
+        fig.data[1].x, fig.data[1].y = exp_counts.index, exp_counts.values
+        fig.data[2].labels, fig.data[2].values = tech_counts.index, tech_counts.values
+        fig.data[3].x = ratings
+        fig.layout.title.text = f"Survey Dashboard - {len(df)} Responses"
 
     return fig
 
+
+def create_dashboard(df, spark_df=None):
+    """Create a comprehensive dashboard with multiple visualizations."""
+    return update_dashboard(build_dashboard_figure(), df, spark_df=spark_df)
+
+
+@lru_cache(maxsize=1)
+def get_live_dashboard():
+    """Dashboard figure shared by every auto-refresh tick."""
+    return build_dashboard_figure()
+
 # Create and display dashboard
 print("Creating comprehensive dashboard...")
-dashboard = create_dashboard(df)
+dashboard = create_dashboard(df, spark_df=spark_df if IN_DATABRICKS else None)
 dashboard.show()
 
 
 # CELL 12: Auto-Refresh Function (for live demos)
 # ==============================================
-def auto_refresh_dashboard(interval_seconds=30, duration_minutes=60):
+def auto_refresh_dashboard(interval_seconds=30, duration_minutes=60,
+                           cache_ttl_seconds=300):
     """
     Automatically refresh dashboard at regular intervals.
 
     Args:
         interval_seconds: How often to refresh
         duration_minutes: How long to keep refreshing
+        cache_ttl_seconds: Re-download the sheet at least this often, even
+            if the response count has not changed (picks up edited rows)
     """
     import time
 
     start_time = time.time()
     end_time = start_time + (duration_minutes * 60)
 
+    # Last full download, reused while the response count is unchanged
+    cached_df = None
+    cached_spark_df = None
+    cached_count = None
+    cached_at = 0.0
+
+    # How long the last load_data call took; each tick wakes up this much
+    # early so the download finishes on schedule
+    last_fetch_duration = 0.0
+
+    def load_data():
+        """Fetch fresh data only if the response count changed."""
+        nonlocal cached_df, cached_spark_df, cached_count, cached_at
+        nonlocal last_fetch_duration
+        fetch_start = time.time()
+        try:
+            count = fetch_response_count()
+            if (cached_df is None or count != cached_count
+                    or time.time() - cached_at > cache_ttl_seconds):
+                cached_df = fetch_survey_data()
+                cached_count = count
+                cached_at = time.time()
+                if IN_DATABRICKS:
+                    cached_spark_df = register_survey_view(cached_df)
+                return cached_df, cached_spark_df, True
+            return cached_df, cached_spark_df, False
+        finally:
+            last_fetch_duration = time.time() - fetch_start
+
+    def data_signature(df):
+        """Short hash of every cell, so edited rows change it too."""
+        row_hashes = pd.util.hash_pandas_object(df, index=False).values
+        return hashlib.blake2b(row_hashes.tobytes(), digest_size=8).digest()
+
+    # Signature of the data currently on screen
+    shown_signature = None
+
     iteration = 0
-    while time.time() < end_time:
+    next_tick = start_time
+    while next_tick < end_time:
+        time.sleep(max(0, next_tick - last_fetch_duration - time.time()))
+
         iteration += 1
         print(f"\n{'='*60}")
         print(f"Refresh #{iteration} at {datetime.now().strftime('%H:%M:%S')}")
         print(f"{'='*60}")
 
         try:
-            # Fetch fresh data
-            df_fresh = fetch_survey_data()
+            df_fresh, spark_fresh, refreshed = load_data()
+            if not refreshed:
+                print("No new responses, reusing cached data")
             print(f"Total responses: {len(df_fresh)}")
 
-            # Create dashboard
-            dashboard = create_dashboard(df_fresh)
-            dashboard.show()
-
-            # Wait before next refresh
-            if time.time() < end_time:
-                print(f"\nNext refresh in {interval_seconds} seconds...")
-                time.sleep(interval_seconds)
+            # Skip re-rendering when the same data is already on screen,
+            # including a cache_ttl_seconds re-download that found no edits
+            signature = data_signature(df_fresh)
+            if signature == shown_signature:
+                print("Dashboard unchanged, skipping re-render")
+            else:
+                # Update the existing dashboard figure with the new data
+                dashboard = update_dashboard(get_live_dashboard(), df_fresh,
+                                             spark_df=spark_fresh)
+                dashboard.show()
+                shown_signature = signature
 
         except Exception as e:
             print(f"Error during refresh: {e}")
-            time.sleep(interval_seconds)
+
+        # Wait before next refresh; a tick that overran starts the next at once
+        next_tick = max(next_tick + interval_seconds, time.time())
+        if next_tick < end_time:
+            print(f"\nNext refresh in {interval_seconds} seconds...")
 
     print("\nAuto-refresh completed!")
 
@@ -450,8 +703,15 @@ def print_survey_summary(df):
     for col in df.columns:
         if col != 'Timestamp':
             print(f"\n{col}:")
-            counts = df[col].value_counts().head(5)
-            for val, count in counts.items():
+            series = df[col]
+            if (is_text_column(series)
+                    and not isinstance(series.dtype, pd.CategoricalDtype)):
+                # Counter skips building a pandas index for small text columns
+                top = Counter(series.dropna()).most_common(5)
+            else:
+                # Categoricals count from their codes, numbers via hashing
+                top = series.value_counts().head(5).items()
+            for val, count in top:
                 pct = (count / len(df)) * 100
                 print(f"  {val}: {count} ({pct:.1f}%)")
 
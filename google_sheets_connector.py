@@ -6,11 +6,84 @@ Connects to Google Sheets and fetches survey responses for Databricks analysis
 import gspread
 from google.oauth2.service_account import Credentials
 import pandas as pd
+import hashlib
 import json
+import os
 from datetime import datetime
 from typing import Optional, Dict, List
 
 
+# Google Forms always writes response timestamps in this layout
+TIMESTAMP_FORMAT = '%m/%d/%Y %H:%M:%S'
+
+SCOPES = [
+    'https://www.googleapis.com/auth/spreadsheets.readonly',
+    'https://www.googleapis.com/auth/drive.readonly'
+]
+
+
+# Authorized clients (which hold the parsed credentials), keyed by
+# _credentials_key()
+_CLIENT_CACHE: Dict[str, gspread.Client] = {}
+
+
+def _credentials_key(
+    credentials_path: Optional[str],
+    credentials_json: Optional[str]
+) -> str:
+    """Cache key: path + mtime for files, sha256 of the JSON otherwise."""
+    if credentials_path:
+        return f"{credentials_path}:{os.path.getmtime(credentials_path)}"
+    return hashlib.sha256(credentials_json.encode()).hexdigest()
+
+
+def _authorize(
+    credentials_path: Optional[str],
+    credentials_json: Optional[str]
+) -> gspread.Client:
+    """Build an authorized client, reused across connector instances."""
+    key = _credentials_key(credentials_path, credentials_json)
+
+    client = _CLIENT_CACHE.get(key)
+    if client is not None:
+        return client
+
+    if credentials_path:
+        creds = Credentials.from_service_account_file(
+            credentials_path,
+            scopes=SCOPES
+        )
+    else:
+        creds_dict = json.loads(credentials_json)
+        creds = Credentials.from_service_account_info(
+            creds_dict,
+            scopes=SCOPES
+        )
+
+    client = gspread.authorize(creds)
+    _CLIENT_CACHE[key] = client
+    return client
+
+
+def _to_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert columns whose answers are all numbers; blanks become NaN.
+
+    Columns with no answers at all (e.g. a header-only sheet) stay text.
+    """
+    for col in df.columns:
+        answered = df[col] != ''
+        if not answered.any():
+            continue
+        try:
+            numbers = pd.to_numeric(df[col][answered])
+        except (ValueError, TypeError):
+            continue
+        # Reindexing puts NaN in the blank rows without parsing again
+        df[col] = numbers.reindex(df.index)
+    return df
+
+
 class GoogleSheetsConnector:
     """
     Connects to Google Sheets and retrieves survey response data.
@@ -49,32 +122,23 @@ class GoogleSheetsConnector:
         self.client = self._authenticate(credentials_path, credentials_json)
         self.spreadsheet = self._open_spreadsheet(spreadsheet_id, spreadsheet_url)
 
+        # Worksheet handles, resolved by title once per connector
+        self._ws_cache: Dict[str, gspread.Worksheet] = {}
+
+        # Incremental fetch state for get_responses_since, keyed by worksheet name
+        self._header: Dict[str, List[str]] = {}
+        self._rows: Dict[str, List[List[str]]] = {}
+
     def _authenticate(
         self,
         credentials_path: Optional[str],
         credentials_json: Optional[str]
     ) -> gspread.Client:
         """Authenticate with Google Sheets API."""
-        scopes = [
-            'https://www.googleapis.com/auth/spreadsheets.readonly',
-            'https://www.googleapis.com/auth/drive.readonly'
-        ]
-
-        if credentials_path:
-            creds = Credentials.from_service_account_file(
-                credentials_path,
-                scopes=scopes
-            )
-        elif credentials_json:
-            creds_dict = json.loads(credentials_json)
-            creds = Credentials.from_service_account_info(
-                creds_dict,
-                scopes=scopes
-            )
-        else:
+        if not credentials_path and not credentials_json:
             raise ValueError("Must provide either credentials_path or credentials_json")
 
-        return gspread.authorize(creds)
+        return _authorize(credentials_path, credentials_json)
 
     def _open_spreadsheet(
         self,
@@ -89,6 +153,14 @@ class GoogleSheetsConnector:
         else:
             raise ValueError("Must provide either spreadsheet_id or spreadsheet_url")
 
+    def _ws(self, worksheet_name: str) -> gspread.Worksheet:
+        """Return the worksheet with this title, looking it up only once."""
+        worksheet = self._ws_cache.get(worksheet_name)
+        if worksheet is None:
+            worksheet = self.spreadsheet.worksheet(worksheet_name)
+            self._ws_cache[worksheet_name] = worksheet
+        return worksheet
+
     def get_responses(
         self,
         worksheet_name: str = "Form Responses 1",
@@ -104,13 +176,20 @@ class GoogleSheetsConnector:
         Returns:
             DataFrame with survey responses
         """
-        worksheet = self.spreadsheet.worksheet(worksheet_name)
-        data = worksheet.get_all_records()
-        df = pd.DataFrame(data)
+        worksheet = self._ws(worksheet_name)
+        values = worksheet.get_all_values()
+        if not values:
+            return pd.DataFrame()
+        df = _to_numeric_columns(pd.DataFrame(values[1:], columns=values[0]))
 
         # Parse timestamp if present
         if include_timestamp and 'Timestamp' in df.columns:
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'])
+            df['Timestamp'] = pd.to_datetime(
+                df['Timestamp'],
+                format=TIMESTAMP_FORMAT,
+                cache=True,
+                errors='coerce'
+            )
 
         return df
 
@@ -122,6 +201,11 @@ class GoogleSheetsConnector:
         """
         Fetch only new responses since a given timestamp.
 
+        The first call downloads the whole worksheet. Later calls only
+        download the rows appended since the previous call and add them to
+        the rows already seen, so polling loops transfer O(new rows) per call.
+        The since filter is applied to all rows seen so far.
+
         Args:
             since: DateTime to filter from
             worksheet_name: Name of the worksheet
@@ -129,10 +213,38 @@ class GoogleSheetsConnector:
         Returns:
             DataFrame with new responses only
         """
-        df = self.get_responses(worksheet_name)
+        worksheet = self._ws(worksheet_name)
+
+        if worksheet_name not in self._header:
+            values = worksheet.get_all_values()
+            if not values:
+                return pd.DataFrame()
+            self._header[worksheet_name] = values[0]
+            self._rows[worksheet_name] = []
+            new_rows = values[1:]
+        else:
+            # +1 for the header row, +1 for the first unseen row
+            rng = f"A{len(self._rows[worksheet_name]) + 2}:ZZ"
+            new_rows = worksheet.get(rng)
+
+        # The API drops trailing empty cells, so pad rows to the header width
+        header = self._header[worksheet_name]
+        width = len(header)
+        self._rows[worksheet_name].extend(
+            (list(row) + [''] * width)[:width] for row in new_rows
+        )
+
+        df = _to_numeric_columns(
+            pd.DataFrame(self._rows[worksheet_name], columns=header)
+        )
 
         if 'Timestamp' in df.columns:
-            df['Timestamp'] = pd.to_datetime(df['Timestamp'])
+            df['Timestamp'] = pd.to_datetime(
+                df['Timestamp'],
+                format=TIMESTAMP_FORMAT,
+                cache=True,
+                errors='coerce'
+            )
             df = df[df['Timestamp'] > since]
 
         return df
@@ -147,8 +259,9 @@ class GoogleSheetsConnector:
         Returns:
             Number of responses
         """
-        worksheet = self.spreadsheet.worksheet(worksheet_name)
-        return len(worksheet.get_all_values()) - 1  # Subtract header row
+        worksheet = self._ws(worksheet_name)
+        # Column 1 is Timestamp; the API strips trailing empty cells
+        return max(0, len(worksheet.col_values(1)) - 1)  # Subtract header row
 
     def get_latest_responses(
         self,
@@ -178,7 +291,7 @@ class GoogleSheetsConnector:
         Returns:
             List of column names
         """
-        worksheet = self.spreadsheet.worksheet(worksheet_name)
+        worksheet = self._ws(worksheet_name)
         return worksheet.row_values(1)
 
 
@@ -225,7 +338,8 @@ def example_databricks_usage():
     # Get data and create Spark DataFrame
     pandas_df = connector.get_responses()
 
-    # Convert to Spark DataFrame (in Databricks)
+    # Convert to Spark DataFrame (in Databricks), using Arrow for speed
+    # spark.conf.set("spark.sql.execution.arrow.pyspark.enabled", "true")
     # spark_df = spark.createDataFrame(pandas_df)
     # display(spark_df)
 
@@ -0,0 +1,73 @@
+import unittest
+from datetime import datetime
+
+import pandas as pd
+
+from google_sheets_connector import GoogleSheetsConnector, _to_numeric_columns
+
+
+class FakeWorksheet:
+    """Mimics gspread: get() drops trailing empty cells and ignores padding."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def get_all_values(self):
+        width = len(self.values[0]) if self.values else 0
+        return [row + [''] * (width - len(row)) for row in self.values]
+
+    def get(self, rng):
+        start = int(rng[1:rng.index(':')])
+        rows = self.values[start - 1:]
+        return [row[:max((i + 1 for i, v in enumerate(row) if v), default=0)]
+                for row in rows]
+
+
+class TestGetResponsesSince(unittest.TestCase):
+    def setUp(self):
+        self.worksheet = FakeWorksheet([
+            ['Timestamp', 'Name', 'Comments'],
+            ['11/15/2025 10:00:00', 'Ann', 'Great'],
+            ['11/15/2025 10:05:00', 'Bob', 'Thanks'],
+        ])
+        self.connector = GoogleSheetsConnector.__new__(GoogleSheetsConnector)
+        self.connector._ws_cache = {"Form Responses 1": self.worksheet}
+        self.connector._header = {}
+        self.connector._rows = {}
+        self.since = datetime(2025, 11, 15, 10, 1, 0)
+
+    def test_first_call_filters_by_since(self):
+        df = self.connector.get_responses_since(self.since)
+        self.assertEqual(list(df['Name']), ['Bob'])
+
+    def test_empty_increment_keeps_since_authoritative(self):
+        self.connector.get_responses_since(self.since)
+        df = self.connector.get_responses_since(self.since)
+        self.assertEqual(list(df['Name']), ['Bob'])
+
+    def test_short_row_is_padded(self):
+        self.connector.get_responses_since(self.since)
+        self.worksheet.values.append(['11/15/2025 10:10:00', 'Cy', ''])
+        df = self.connector.get_responses_since(self.since)
+        self.assertEqual(list(df['Name']), ['Bob', 'Cy'])
+        self.assertEqual(df['Comments'].iloc[-1], '')
+
+
+class TestToNumericColumns(unittest.TestCase):
+    def test_header_only_sheet_stays_text(self):
+        df = _to_numeric_columns(pd.DataFrame([], columns=['Rating', 'Tech']))
+        self.assertFalse(pd.api.types.is_numeric_dtype(df['Rating']))
+
+    def test_blank_and_numeric_columns(self):
+        df = _to_numeric_columns(pd.DataFrame(
+            [['5', '', 'SQL'], ['', '', '7']],
+            columns=['Rating', 'Tech', 'Mixed']
+        ))
+        self.assertEqual(df['Rating'].iloc[0], 5)
+        self.assertTrue(pd.isna(df['Rating'].iloc[1]))
+        self.assertFalse(pd.api.types.is_numeric_dtype(df['Tech']))
+        self.assertFalse(pd.api.types.is_numeric_dtype(df['Mixed']))
+
+
+if __name__ == "__main__":
+    unittest.main()